@@ -5,7 +5,7 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 import os
@@ -20,7 +20,7 @@ app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
 # In-memory activity database
-activities = {
+app.state.activities = {
     "Baseball Team": {
         "description": "Join our competitive baseball team and compete in league games",
         "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
@@ -78,18 +78,24 @@ activities = {
 }
 
 
+def get_activities_db():
+    """Dependency that provides the activity database"""
+    return app.state.activities
+
+
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.get("/activities")
-def get_activities():
+def get_activities(activities: dict = Depends(get_activities_db)):
     return activities
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+def signup_for_activity(activity_name: str, email: str,
+                        activities: dict = Depends(get_activities_db)):
     """Sign up a student for an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -109,7 +115,8 @@ def signup_for_activity(activity_name: str, email: str):
 
 
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+def unregister_from_activity(activity_name: str, email: str,
+                             activities: dict = Depends(get_activities_db)):
     """Unregister a student from an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -1,82 +1,104 @@
+from types import MappingProxyType
+
 import pytest
 from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import app, get_activities_db
 
-from app import app, activities
+# Initial state of the activities database, built once at import time as
+# (name, description, schedule, max_participants, participants) rows
+_ORIGINAL_ACTIVITIES = (
+    ("Baseball Team",
+     "Join our competitive baseball team and compete in league games",
+     "Mondays and Thursdays, 4:00 PM - 5:30 PM",
+     15,
+     ("alex@mergington.edu",)),
+    ("Soccer Club",
+     "Play soccer and develop teamwork skills",
+     "Tuesdays and Fridays, 4:00 PM - 5:30 PM",
+     18,
+     ("jordan@mergington.edu",)),
+    ("Music Band",
+     "Learn to play instruments and perform in school concerts",
+     "Wednesdays, 3:30 PM - 4:30 PM",
+     25,
+     ("maya@mergington.edu", "lucas@mergington.edu")),
+    ("Drama Club",
+     "Act in theatrical productions and develop performance skills",
+     "Thursdays, 4:00 PM - 5:30 PM",
+     20,
+     ("isabella@mergington.edu",)),
+    ("Debate Team",
+     "Compete in debate tournaments and develop public speaking skills",
+     "Mondays and Wednesdays, 3:30 PM - 4:30 PM",
+     16,
+     ("christopher@mergington.edu", "avery@mergington.edu")),
+    ("Science Club",
+     "Explore STEM topics through experiments and projects",
+     "Tuesdays, 3:30 PM - 4:30 PM",
+     20,
+     ("tyler@mergington.edu",)),
+    ("Chess Club",
+     "Learn strategies and compete in chess tournaments",
+     "Fridays, 3:30 PM - 5:00 PM",
+     12,
+     ("michael@mergington.edu", "daniel@mergington.edu")),
+    ("Programming Class",
+     "Learn programming fundamentals and build software projects",
+     "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+     20,
+     ("emma@mergington.edu", "sophia@mergington.edu")),
+    ("Gym Class",
+     "Physical education and sports activities",
+     "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+     30,
+     ("john@mergington.edu", "olivia@mergington.edu")),
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create test client for FastAPI app"""
-    return TestClient(app)
+    """Create a single test client for the FastAPI app, shared across the session"""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def original_activities():
+    """Read-only view of the initial activities database"""
+    return MappingProxyType({
+        name: MappingProxyType({
+            "description": description,
+            "schedule": schedule,
+            "max_participants": max_participants,
+            "participants": participants
+        })
+        for name, description, schedule, max_participants, participants
+        in _ORIGINAL_ACTIVITIES
+    })
 
 
 @pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original activities
-    original_activities = {
-        "Baseball Team": {
-            "description": "Join our competitive baseball team and compete in league games",
-            "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Soccer Club": {
-            "description": "Play soccer and develop teamwork skills",
-            "schedule": "Tuesdays and Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["jordan@mergington.edu"]
-        },
-        "Music Band": {
-            "description": "Learn to play instruments and perform in school concerts",
-            "schedule": "Wednesdays, 3:30 PM - 4:30 PM",
-            "max_participants": 25,
-            "participants": ["maya@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Act in theatrical productions and develop performance skills",
-            "schedule": "Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Compete in debate tournaments and develop public speaking skills",
-            "schedule": "Mondays and Wednesdays, 3:30 PM - 4:30 PM",
-            "max_participants": 16,
-            "participants": ["christopher@mergington.edu", "avery@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Explore STEM topics through experiments and projects",
-            "schedule": "Tuesdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["tyler@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
+def reset_activities(request, original_activities):
+    """Serve a fresh copy of the initial activities to each test"""
+    # Tests marked readonly never mutate state, so they use the app's database
+    if request.node.get_closest_marker("readonly"):
+        yield app.state.activities
+        return
+
+    # Equivalent to a deep copy without copy.deepcopy's memo overhead: each
+    # activity dict and participant list is new, and the remaining values are
+    # immutable strings and ints that are safe to share
+    fresh = {
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in original_activities.items()
     }
-    
-    # Clear and reset activities
-    activities.clear()
-    activities.update(original_activities)
-    yield
+    app.dependency_overrides[get_activities_db] = lambda: fresh
+    yield fresh
+    del app.dependency_overrides[get_activities_db]
+
+
+@pytest.fixture
+def activities(reset_activities):
+    """The activity database served to the current test"""
+    return reset_activities
@@ -4,10 +4,24 @@ Tests for the Mergington High School extracurricular activities API
 
 import pytest
 
+_EXPECTED_ACTIVITY_NAMES = frozenset({
+    "Baseball Team",
+    "Soccer Club",
+    "Music Band",
+    "Drama Club",
+    "Debate Team",
+    "Science Club",
+    "Chess Club",
+    "Programming Class",
+    "Gym Class",
+})
+
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
 
+    pytestmark = pytest.mark.readonly
+
     def test_get_activities_returns_all_activities(self, client):
         """Test that all activities are returned"""
         response = client.get("/activities")
@@ -15,15 +29,7 @@ class TestGetActivities:
         data = response.json()
         
         # Check that we have all activities
-        assert "Baseball Team" in data
-        assert "Soccer Club" in data
-        assert "Music Band" in data
-        assert "Drama Club" in data
-        assert "Debate Team" in data
-        assert "Science Club" in data
-        assert "Chess Club" in data
-        assert "Programming Class" in data
-        assert "Gym Class" in data
+        assert _EXPECTED_ACTIVITY_NAMES <= data.keys()
 
     def test_get_activities_contains_activity_details(self, client):
         """Test that activities contain required fields"""
@@ -51,25 +57,21 @@ class TestGetActivities:
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
 
-    def test_signup_for_activity_success(self, client):
-        """Test successful signup for an activity"""
+    @pytest.mark.parametrize("activity, email", [
+        ("Baseball Team", "newstudent@mergington.edu"),
+        ("Soccer Club", "newstudent@mergington.edu"),
+    ])
+    def test_signup_for_activity_success(self, client, activities, activity, email):
+        """Test successful signup adds the participant to the activity"""
         response = client.post(
-            "/activities/Baseball Team/signup?email=newstudent@mergington.edu"
+            f"/activities/{activity}/signup", params={"email": email}
         )
         assert response.status_code == 200
-        data = response.json()
-        assert "message" in data
-        assert "newstudent@mergington.edu" in data["message"]
-
-    def test_signup_adds_participant_to_activity(self, client):
-        """Test that signup actually adds the participant"""
-        # Signup for activity
-        client.post("/activities/Soccer Club/signup?email=newstudent@mergington.edu")
+        assert b'"message"' in response.content
+        assert email.encode() in response.content
         
         # Verify participant was added
-        response = client.get("/activities")
-        activities = response.json()
-        assert "newstudent@mergington.edu" in activities["Soccer Club"]["participants"]
+        assert email in activities[activity]["participants"]
 
     def test_signup_for_nonexistent_activity_fails(self, client):
         """Test that signup to non-existent activity returns 404"""
@@ -95,7 +97,7 @@ class TestSignupForActivity:
             f"/activities/{activity}/signup?email={email}"
         )
         assert response2.status_code == 400
-        assert "already signed up" in response2.json()["detail"]
+        assert "already signed up" in response2.text
 
     def test_signup_existing_participant_fails(self, client):
         """Test that signup with an already registered participant fails"""
@@ -103,35 +105,27 @@ class TestSignupForActivity:
             "/activities/Baseball Team/signup?email=alex@mergington.edu"
         )
         assert response.status_code == 400
-        assert "already signed up" in response.json()["detail"]
+        assert "already signed up" in response.text
 
 
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
 
-    def test_unregister_success(self, client):
-        """Test successful unregistration from activity"""
+    @pytest.mark.parametrize("activity, email, remaining", [
+        ("Baseball Team", "alex@mergington.edu", []),
+        ("Music Band", "maya@mergington.edu", ["lucas@mergington.edu"]),
+    ])
+    def test_unregister_success(self, client, activities, activity, email, remaining):
+        """Test successful unregistration removes only that participant"""
         response = client.delete(
-            "/activities/Baseball Team/unregister?email=alex@mergington.edu"
+            f"/activities/{activity}/unregister", params={"email": email}
         )
         assert response.status_code == 200
-        data = response.json()
-        assert "message" in data
-        assert "alex@mergington.edu" in data["message"]
-
-    def test_unregister_removes_participant(self, client):
-        """Test that unregister actually removes the participant"""
-        # Unregister
-        client.delete(
-            "/activities/Music Band/unregister?email=maya@mergington.edu"
-        )
+        assert b'"message"' in response.content
+        assert email.encode() in response.content
         
-        # Verify participant was removed
-        response = client.get("/activities")
-        activities = response.json()
-        assert "maya@mergington.edu" not in activities["Music Band"]["participants"]
-        # But lucas should still be there
-        assert "lucas@mergington.edu" in activities["Music Band"]["participants"]
+        # Verify participant was removed but others remain
+        assert activities[activity]["participants"] == remaining
 
     def test_unregister_nonexistent_activity_fails(self, client):
         """Test that unregister from non-existent activity returns 404"""
@@ -147,7 +141,7 @@ class TestUnregisterFromActivity:
             "/activities/Baseball Team/unregister?email=nosuchstudent@mergington.edu"
         )
         assert response.status_code == 400
-        assert "not signed up" in response.json()["detail"]
+        assert "not signed up" in response.text
 
     def test_unregister_twice_fails(self, client):
         """Test that unregistering twice fails on second attempt"""
@@ -168,57 +162,56 @@ class TestUnregisterFromActivity:
             f"/activities/{activity}/unregister?email={email}"
         )
         assert response2.status_code == 400
-        assert "not signed up" in response2.json()["detail"]
+        assert "not signed up" in response2.text
 
 
 class TestIntegration:
     """Integration tests for complete workflows"""
 
-    def test_signup_and_unregister_workflow(self, client):
+    def test_signup_and_unregister_workflow(self, client, activities):
         """Test complete signup and unregister workflow"""
         email = "workflow@mergington.edu"
         activity = "Science Club"
         
         # Verify student not in activity
-        response = client.get("/activities")
-        assert email not in response.json()[activity]["participants"]
+        assert email not in activities[activity]["participants"]
         
         # Signup
         response = client.post(f"/activities/{activity}/signup?email={email}")
         assert response.status_code == 200
         
         # Verify student is now in activity
-        response = client.get("/activities")
-        assert email in response.json()[activity]["participants"]
+        assert email in activities[activity]["participants"]
         
         # Unregister
         response = client.delete(f"/activities/{activity}/unregister?email={email}")
         assert response.status_code == 200
         
-        # Verify student is removed from activity
+        # Verify the API reports the student as removed from activity
         response = client.get("/activities")
         assert email not in response.json()[activity]["participants"]
 
-    def test_multiple_signups_and_unregisters(self, client):
+    def test_multiple_signups_and_unregisters(self, client, activities):
         """Test multiple students signing up and unregistering"""
         activity = "Chess Club"
+        signup_url = f"/activities/{activity}/signup"
+        unregister_url = f"/activities/{activity}/unregister"
         students = ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"]
         
         # All students signup
         for email in students:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
+            response = client.post(signup_url, params={"email": email})
             assert response.status_code == 200
         
         # Verify all are signed up
-        response = client.get("/activities")
         for email in students:
-            assert email in response.json()[activity]["participants"]
+            assert email in activities[activity]["participants"]
         
         # Unregister student2
-        response = client.delete(f"/activities/{activity}/unregister?email={students[1]}")
+        response = client.delete(unregister_url, params={"email": students[1]})
         assert response.status_code == 200
         
-        # Verify student2 is removed but others remain
+        # Verify the API reports student2 as removed but others remaining
         response = client.get("/activities")
         participants = response.json()[activity]["participants"]
         assert students[0] in participants